@@ -1,18 +1,45 @@
+import functools
+import os
+import sys
+
 import orjson
 from pathlib import Path
 from typing import AsyncIterator, Any, Dict, Type, Optional, TYPE_CHECKING
 
-from cr.iterators import PlayerIterator
 from .enums import PETS_ORDER, Resource
 from .miscmodels import try_enum, Badge, TimeDelta
-from .iterators import PlayerIterator
-from .utils import CaseInsensitiveDict, UnitStat, _get_maybe_first
+from .utils import UnitStat, _get_maybe_first
 
 if TYPE_CHECKING:
     from .players import Player
 
-BUILDING_FILE_PATH = Path(__file__).parent.joinpath(
-    Path("static/buildings.json"))
+BUILDING_FILE_PATH = os.path.join(os.path.dirname(__file__), "static", "buildings.json")
+
+# the class flag to set for units made in each production building
+_PRODUCTION_BUILDING_FLAGS = {
+    "Barrack": "is_elixir_troop",
+    "Dark Elixir Barrack": "is_dark_troop",
+    "SiegeWorkshop": "is_siege_machine",
+    "Spell Forge": "is_elixir_spell",
+    "Mini Spell Factory": "is_dark_spell",
+}
+
+#hacky but the aliases convert so that isnt great
+_IGNORED_PETS = frozenset(("Unused", "PhoenixEgg"))
+
+# game data files are parsed once and then kept in memory for the life of the process
+@functools.lru_cache(maxsize=None)
+def _load_static_file(file_path) -> dict:
+    return orjson.loads(Path(file_path).read_bytes())
+
+
+def _townhall_to_lab(lab_to_townhall: Dict[int, int]) -> Dict[int, int]:
+    # map each townhall level to the lowest lab level available at it
+    townhall_to_lab = {}
+    for lab_level, th_level in lab_to_townhall.items():
+        if th_level not in townhall_to_lab or lab_level < townhall_to_lab[th_level]:
+            townhall_to_lab[th_level] = lab_level
+    return townhall_to_lab
 
 
 class BaseClan:
@@ -52,6 +79,9 @@ class BaseClan:
     def __eq__(self, other):
         return isinstance(other, BaseClan) and self.tag == other.tag
 
+    def __hash__(self):
+        return hash(self.tag)
+
     @property
     def share_link(self) -> str:
         """str: A formatted link to open the clan in-game"""
@@ -85,6 +115,9 @@ class BasePlayer:
     def __eq__(self, other):
         return isinstance(other, BasePlayer) and self.tag == other.tag
 
+    def __hash__(self):
+        return hash(self.tag)
+
     def __init__(self, *, data, client, **_):
         self._client = client
         self._response_retry = data.get("_response_retry")
@@ -98,29 +131,54 @@ class BasePlayer:
         return f"https://link.clashroyale.com/?playerInfo?id={self.tag.strip('#')}"
 
 
+def _collect_stat(json_meta: dict, levels, key) -> Optional[list]:
+    # returns None if no level has the stat, so we don't build a UnitStat full of Nones
+    values = []
+    seen = False
+    for level in levels:
+        value = json_meta[level].get(key)
+        values.append(value)
+        seen = seen or value is not None
+    return values if seen else None
+
+
 class DataContainerMetaClass(type):
     pass
 
 
+class _LazyUnitStat:
+    """A :class:`UnitStat` that is only built from the game data the first time it's accessed."""
+    __slots__ = ("attr_name", "key", "json_meta", "levels")
+
+    def __init__(self, attr_name, key, json_meta, levels):
+        self.attr_name = attr_name
+        self.key = key
+        self.json_meta = json_meta
+        self.levels = levels
+
+    def __get__(self, instance, owner):
+        stat = try_enum(UnitStat, _collect_stat(self.json_meta, self.levels, self.key))
+        # replace ourselves with the real stat, so later lookups don't go through here again
+        setattr(owner, self.attr_name, stat)
+        if isinstance(stat, UnitStat):
+            return stat.__get__(instance, owner)
+        return stat
+
+
 class DataContainer(metaclass=DataContainerMetaClass):
     lab_to_townhall: Dict[int, int]
     name: str
 
     def __init__(self, data, townhall):
-        self.name: str = data["name"]
+        # names and villages come from a small fixed set, so share a single string object for each
+        self.name: str = sys.intern(data["name"])
         self.level: int = data["level"]
         self.max_level: int = data["maxLevel"]
-        self.village: str = data["village"]
+        self.village: str = sys.intern(data["village"])
         self.is_active: bool = data.get("superTroopIsActive")
 
         self._townhall = townhall
 
-        # copies for a static hash
-        self.__name = data['name']
-        self.__level = data['level']
-        self.__village = data['village']
-        self.__is_active = data.get("superTroopIsActive")
-
     def __repr__(self):
         attrs = [
             ("name", self.name),
@@ -135,44 +193,55 @@ class DataContainer(metaclass=DataContainerMetaClass):
             and self.village == other.village and self.is_active == other.is_active
 
     def __hash__(self):
-        return hash((self.__name, self.__level, self.__village, self.__is_active))
+        return hash((self.name, self.level, self.village, self.is_active))
 
 
     @classmethod
-    def _load_json_meta(cls, json_meta: dict, id, name: str, lab_to_townhall):
+    def _load_json_meta(cls, json_meta: dict, id, name: str, lab_to_townhall, townhall_to_lab=None):
         cls.id = int(id)
         cls.name = name
         cls.lab_to_townhall = lab_to_townhall
-
-        levels_available = [key for key in json_meta.keys() if key.isnumeric()]
+        if townhall_to_lab is None:
+            townhall_to_lab = _townhall_to_lab(lab_to_townhall)
+
+        levels_available = [key for key in json_meta if key.isdigit()]
+
+        # collect the per-level stats needed while loading in a single pass over the levels,
+        # the rest are only built on first access
+        dps, required_townhall_levels, raw_laboratory_levels = [], [], []
+        upgrade_times, regeneration_times = [], []
+        for level in levels_available:
+            level_meta = json_meta[level]
+            dps.append(level_meta.get("DPS"))
+            required_townhall_levels.append(level_meta.get("RequiredTownHallLevel"))
+            raw_laboratory_levels.append(level_meta.get("LaboratoryLevel"))
+
+            upgrade_time = level_meta.get("UpgradeTimeH")
+            if upgrade_time is not None:
+                upgrade_times.append(TimeDelta(hours=upgrade_time))
+            regeneration_time = level_meta.get("RegenerationTimeMinutes")
+            if regeneration_time is not None:
+                regeneration_times.append(TimeDelta(minutes=regeneration_time))
 
         cls.ground_target = json_meta.get("GroundTargets", True)
-        cls.range = try_enum(UnitStat, [json_meta.get(level).get("AttackRange") for level in levels_available])
-        cls.dps = try_enum(UnitStat, [json_meta.get(level).get("DPS") for level in levels_available])
-        cls.hitpoints = try_enum(UnitStat, [json_meta.get(level).get("Hitpoints") for level in levels_available])
+        cls.range = _LazyUnitStat("range", "AttackRange", json_meta, levels_available)
+        cls.dps = try_enum(UnitStat, dps)
+        cls.hitpoints = _LazyUnitStat("hitpoints", "Hitpoints", json_meta, levels_available)
 
         # get production building
         production_building = json_meta.get("ProductionBuilding")
-        if production_building == "Barrack":
-            cls.is_elixir_troop = True
-        elif production_building == "Dark Elixir Barrack":
-            cls.is_dark_troop = True
-        elif production_building == "SiegeWorkshop":
-            cls.is_siege_machine = True
-        elif production_building == "Spell Forge":
-            cls.is_elixir_spell = True
-        elif production_building == "Mini Spell Factory":
-            cls.is_dark_spell = True
+        production_flag = _PRODUCTION_BUILDING_FLAGS.get(production_building)
+        if production_flag:
+            setattr(cls, production_flag, True)
         elif name in PETS_ORDER:
             production_building = "Pet Shop"
 
         # load buildings
-        with open(BUILDING_FILE_PATH, 'rb') as fp:
-            buildings = orjson.loads(fp.read())
+        buildings = _load_static_file(BUILDING_FILE_PATH)
 
         # without production_building, it is a hero
         if not production_building:
-            laboratory_levels = [json_meta.get(level).get("LaboratoryLevel") for level in levels_available]
+            laboratory_levels = raw_laboratory_levels
         else:
             prod_unit = buildings.get(production_building)
             if production_building in ("SiegeWorkshop", "Spell Forge", "Mini Spell Factory",
@@ -180,34 +249,30 @@ class DataContainer(metaclass=DataContainerMetaClass):
                 min_prod_unit_level = json_meta.get("BarrackLevel", None)
                 # there are some special troops, which have no BarrackLevel attribute
                 if not min_prod_unit_level:
-                    laboratory_levels = [json_meta.get(level).get("LaboratoryLevel") for level in levels_available]
+                    laboratory_levels = raw_laboratory_levels
                 else:
                     #get the townhall level of the spot where prod building level is equal to the one of the unit
-                    min_th_level = prod_unit.get(str(min_prod_unit_level)).get("TownHallLevel", 0)
+                    min_th_level = prod_unit[str(min_prod_unit_level)].get("TownHallLevel", 0)
                     # map the min th level to a lab level
-                    [first_lab_level] = [lab_level for lab_level, th_level in lab_to_townhall.items() if th_level == min_th_level]
+                    first_lab_level = townhall_to_lab[min_th_level]
                     # the first_lab_level is the lowest possible (there are some inconsistencies with siege machines)
                     # To handle them properly, replacing all lab_level lower than first_lab_level with first_lab_level
-                    laboratory_levels = []
-                    for lab_level in [json_meta.get(level).get("LaboratoryLevel", 1) for level in levels_available]:
-                        laboratory_levels.append(max(lab_level, first_lab_level))
+                    laboratory_levels = [max(lab_level or 1, first_lab_level) for lab_level in raw_laboratory_levels]
 
 
 
 
             elif production_building == "Pet Shop":
-                min_prod_unit_level = json_meta.get("1").get("LaboratoryLevel")
+                min_prod_unit_level = json_meta["1"].get("LaboratoryLevel")
 
                 # get the min th level were we can unlock by the required level of the production building
-                min_th_level = prod_unit.get(str(min_prod_unit_level)).get("TownHallLevel", 0)
+                min_th_level = prod_unit[str(min_prod_unit_level)].get("TownHallLevel", 0)
 
                 # map the min th level to a lab level
-                [first_lab_level] = [lab_level for lab_level, th_level in lab_to_townhall.items() if th_level == min_th_level]
+                first_lab_level = townhall_to_lab[min_th_level]
                 # the first_lab_level is the lowest possible (there are some inconsistencies with siege machines)
                 # To handle them properly, replacing all lab_level lower than first_lab_level with first_lab_level
-                laboratory_levels = []
-                for lab_level in [json_meta.get(level).get("LaboratoryLevel") for level in levels_available]:
-                    laboratory_levels.append(max(lab_level, first_lab_level))
+                laboratory_levels = [max(lab_level, first_lab_level) for lab_level in raw_laboratory_levels]
 
             else:
                 return
@@ -215,16 +280,11 @@ class DataContainer(metaclass=DataContainerMetaClass):
         cls.lab_level = try_enum(UnitStat, laboratory_levels)
         cls.housing_space = json_meta.get("HousingSpace", 0)
 
-        cls.speed = try_enum(UnitStat, [json_meta.get(level).get("Speed") for level in levels_available])
+        cls.speed = _LazyUnitStat("speed", "Speed", json_meta, levels_available)
         cls.level = cls.dps and UnitStat(range(1, len(cls.dps) + 1))
 
-        cls.upgrade_cost = try_enum(UnitStat, [json_meta.get(level).get("UpgradeCost") for level in levels_available])
+        cls.upgrade_cost = _LazyUnitStat("upgrade_cost", "UpgradeCost", json_meta, levels_available)
         cls.upgrade_resource = Resource(value=json_meta.get("UpgradeResource"))
-        upgrade_times = [
-            TimeDelta(hours=json_meta.get(level, {}).get("UpgradeTimeH"))
-            for level in levels_available
-            if json_meta.get(level, {}).get("UpgradeTimeH") is not None
-        ]
         cls.upgrade_time = try_enum(UnitStat, upgrade_times)
 
         cls._is_home_village = False if json_meta.get("VillageType") else True
@@ -233,17 +293,12 @@ class DataContainer(metaclass=DataContainerMetaClass):
         cls.training_time = TimeDelta(seconds=json_meta.get("TrainingTime"))
 
         # only heroes
-        cls.ability_time = try_enum(UnitStat, [json_meta.get(level).get("AbilityTime") for level in levels_available])
-        cls.ability_troop_count = try_enum(UnitStat, [json_meta.get(level).get("AbilitySummonTroopCount") for level in levels_available])
+        cls.ability_time = _LazyUnitStat("ability_time", "AbilityTime", json_meta, levels_available)
+        cls.ability_troop_count = _LazyUnitStat("ability_troop_count", "AbilitySummonTroopCount",
+                                                json_meta, levels_available)
 
-        required_townhall_levels = [json_meta.get(level).get("RequiredTownHallLevel") for level in levels_available]
         cls.required_th_level = try_enum(UnitStat, required_townhall_levels if any(required_townhall_levels) else laboratory_levels)
 
-        regeneration_times = [
-            TimeDelta(minutes=json_meta.get(level, {}).get("RegenerationTimeMinutes"))
-            for level in levels_available
-            if json_meta.get(level, {}).get("RegenerationTimeMinutes") is not None
-        ]
         cls.regeneration_time = try_enum(UnitStat, regeneration_times)
 
         cls.is_loaded = True
@@ -281,18 +336,24 @@ class DataContainer(metaclass=DataContainerMetaClass):
 
 class DataContainerHolder:
     items = NotImplemented
-    item_lookup: CaseInsensitiveDict = CaseInsensitiveDict()
+    # shared fallback for subclasses that don't call DataContainerHolder.__init__
+    item_lookup: Dict[str, Type[DataContainer]] = {}
 
     FILE_PATH = NotImplemented
     data_object = NotImplemented
 
     def __init__(self):
         self.loaded = False
+        # keyed by the lowercased item name, for case-insensitive lookups
+        self.item_lookup = {}
 
     def _load_json(self, english_aliases, lab_to_townhall):
-        with open(self.FILE_PATH, 'rb') as fp:
-            data = orjson.loads(fp.read())
+        data = _load_static_file(self.FILE_PATH)
+        townhall_to_lab = _townhall_to_lab(lab_to_townhall)
+
+        is_pets_file = "pets" in str(self.FILE_PATH)
 
+        new_items = []
         id = 2000
         for c, [supercell_name, meta] in enumerate(data.items()):
 
@@ -305,32 +366,34 @@ class DataContainerHolder:
                 continue
 
             # SC game files have "DisableProduction" true for all pet objects, which we want
-            if meta.get("DisableProduction") and "pets" not in str(self.FILE_PATH):
+            if meta.get("DisableProduction") and not is_pets_file:
                 continue
 
             # ignore deprecated content
             if meta.get("Deprecated"):
                 continue
 
-            #hacky but the aliases convert so that isnt great
-            IGNORED_PETS = ["Unused", "PhoenixEgg"]
-            if "pets" in str(self.FILE_PATH) and supercell_name in IGNORED_PETS:
+            if is_pets_file and supercell_name in _IGNORED_PETS:
                 continue
 
-            # A bit of a hacky way to create a "copy" of a new Troop object that hasn't been initiated yet.
-            new_item = type(self.data_object.__name__,
-                            self.data_object.__bases__,
-                            dict(self.data_object.__dict__))
+            # Each item gets its own copy of the data object class to hold the game data. The copies are siblings
+            # rather than subclasses, so loading a fallback item from a parent can't leak into the loaded items.
+            new_item = DataContainerMetaClass(self.data_object.__name__,
+                                              self.data_object.__bases__,
+                                              {k: v for k, v in self.data_object.__dict__.items()
+                                               if k not in ("__dict__", "__weakref__")})
             new_item._load_json_meta(
                 meta,
                 id=id,
                 name=english_aliases[meta.get("TID")],
                 lab_to_townhall=lab_to_townhall,
+                townhall_to_lab=townhall_to_lab,
             )
             id += 1
-            self.items.append(new_item)
-            self.item_lookup[new_item.name] = new_item
+            new_items.append(new_item)
+            self.item_lookup[new_item.name.lower()] = new_item
 
+        self.items.extend(new_items)
         self.loaded = True
 
     def load(
@@ -338,7 +401,7 @@ class DataContainerHolder:
             load_game_data: bool = True) -> DataContainer:
         if load_game_data is True:
             try:
-                item = self.item_lookup[data["name"]]
+                item = self.item_lookup[data["name"].lower()]
             except KeyError:
                 item = default or self.data_object
         else:
@@ -348,6 +411,6 @@ class DataContainerHolder:
 
     def get(self, name: str) -> Optional[Type[DataContainer]]:
         try:
-            return self.item_lookup[name]
+            return self.item_lookup[name.lower()]
         except KeyError:
             return None
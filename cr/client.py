@@ -23,7 +23,7 @@ from .iterators import (
 )
 from .players import Player, ClanMember, RankedPlayer
 
-from .utils import correct_tag, get, parse_army_link
+from .utils import FIFO, correct_tag, get, parse_army_link
 
 from .entry_logs import ClanWarLog, RaidLog
 
@@ -170,6 +170,7 @@ class Client:
         "_players",
         "_clans",
         "_wars",
+        "_arena_cache",
         "objects_cls",
         "_troop_holder",
         "_spell_holder",
@@ -240,6 +241,8 @@ class Client:
         self._players = {}
         self._clans = {}
         self._wars = {}
+        # arenas are shared between players, see players._get_arena
+        self._arena_cache = FIFO(256)
 
     @property
     def _defaults(self):
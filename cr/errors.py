@@ -49,11 +49,11 @@ class HTTPException(ClashOfClansException):
             self.reason = "Unknown"
             self.message = None
 
-        fmt = "{0.reason} (status code: {0.status})"
+        msg = f"{self.reason} (status code: {self.status})"
         if self.message:
-            fmt += ": {0.message}"
+            msg += f": {self.message}"
 
-        super().__init__(fmt.format(self))
+        super().__init__(msg)
 
     def __init__(self, response=None, data=None):
         if isinstance(response, (ClientResponse, int)):
@@ -64,8 +64,7 @@ class HTTPException(ClashOfClansException):
             self.reason = None
             self.message = response
 
-            fmt = "Error Occurred: {0}"
-            super().__init__(fmt.format(self.message))
+            super().__init__(f"Error Occurred: {self.message}")
 
 
 class InvalidArgument(HTTPException):
@@ -9,7 +9,6 @@ from time import process_time, perf_counter
 from typing import Optional
 from urllib.parse import urlencode
 from base64 import b64decode as base64_b64decode
-from json import loads as json_loads
 
 import aiohttp
 import orjson
@@ -516,15 +515,15 @@ class HTTPClient:
 
             LOG.info("Successfully logged into the developer site.")
 
-            resp_payload = await resp.json()
+            resp_payload = await resp.json(loads=orjson.loads)
             if not self.ip:
-                ip = json_loads(base64_b64decode(resp_payload["temporaryAPIToken"].split(".")[1] + "====").decode("utf-8"))["limits"][1]["cidrs"][0].split("/")[0]
+                ip = orjson.loads(base64_b64decode(resp_payload["temporaryAPIToken"].split(".")[1] + "===="))["limits"][1]["cidrs"][0].split("/")[0]
             else:
                 ip = self.ip
             LOG.info("Found IP address to be %s", ip)
 
             resp = await session.post("https://developer.clashroyale.com/api/apikey/list")
-            keys = (await resp.json())["keys"]
+            keys = (await resp.json(loads=orjson.loads))["keys"]
             for key in keys:
                 LOG.debug(f"Key {key}")
                 if key["name"] != self.key_names or ip not in key["cidrRanges"]:
@@ -558,7 +557,7 @@ class HTTPClient:
                     LOG.info("Creating key with data %s.", str(data))
 
                     resp = await session.post("https://developer.clashroyale.com/api/apikey/create", json=data)
-                    key = await resp.json()
+                    key = await resp.json(loads=orjson.loads)
 
                     if resp.status != 200:
                         LOG.error(key.get("description"))
@@ -31,9 +31,9 @@ class Achievement:
     info:
         :class:`str`: Information regarding the achievement.
     completion_info:
-        :class:`str`: Information regarding completion of the achievement.
+        Optional[:class:`str`]: Information regarding completion of the achievement.
     village:
-        :class:`str`: Either ``home`` or ``builderBase``.
+        Optional[:class:`str`]: Either ``home`` or ``builderBase``. ``None`` if the API doesn't send it.
     """
 
     __slots__ = (
@@ -66,8 +66,8 @@ class Achievement:
         self.value: int = data["value"]
         self.target: int = data["target"]
         self.info: str = data["info"]
-        self.completion_info: str = data["completionInfo"]
-        self.village: str = data["village"]
+        self.completion_info: Optional[str] = data.get("completionInfo")
+        self.village: Optional[str] = data.get("village")
 
     @property
     def is_builder_base(self) -> bool:
@@ -22,6 +22,29 @@ from .player_clan import PlayerClan, PlayerClan as RankedClan
 from .utils import cached_property
 
 
+_ACHIEVEMENT_INDEX = {name: i for i, name in enumerate(ACHIEVEMENT_ORDER)}
+
+
+def _get_arena(arena_cls, data: dict, client):
+    # arenas are identical for every player in them, so each client shares one instance per arena and class
+    cache = getattr(client, "_arena_cache", None)
+    if cache is None:
+        return arena_cls(data=data, client=client)
+
+    key = (arena_cls, data["id"])
+    try:
+        return cache[key]
+    except KeyError:
+        arena = cache[key] = arena_cls(data=data, client=client)
+        return arena
+
+
+def _build_list(cls, seq, client) -> list:
+    # list items are always dicts from the API, so we can call the constructor directly instead of try_enum
+    if not seq:
+        return []
+    return [cls(data=adata, client=client) for adata in seq]
+
 
 class ClanMember(BasePlayer):
     """Represents a Clash of Clans Clan Member.
@@ -69,37 +92,43 @@ class ClanMember(BasePlayer):
     builder_base_league_cls: :class:`coc.League`
         The class to use to create the :attr:`ClanMember.builder_base_league` attribute.
         Ensure any overriding of this inherits from :class:`coc.BaseLeague`.
+    arena_cls: :class:`Arena`
+        The class to use to create the :attr:`ClanMember.arena` attribute.
+        Ensure any overriding of this inherits from :class:`Arena`.
+
+    .. note::
+
+        The ``*_cls`` constructors are class attributes rather than per-instance ones.
+        To use your own, override them on a subclass.
     """
 
+    # most frequently read attributes first
     __slots__ = (
-        "_client",
+        "trophies",
         "clan",
-        "role",
         "exp_level",
         "arena",
-        "trophies",
-        "clan_rank",
-        "clan_previous_rank",
+        "role",
         "donations",
         "received",
-        "clan_cls",
-        "arena_cls",
+        "clan_rank",
+        "clan_previous_rank",
         "lastSeen",
         "clan_chest_points"
     )
 
+    clan_cls = PlayerClan
+    arena_cls = Arena
+
     def __init__(self, *, data, client, clan=None, **_):
         super().__init__(data=data, client=client)
         self._client = client
-        self.clan_cls = PlayerClan
-        self.arena_cls = Arena
 
-        self._from_data(data)
-        if clan:
-            self.clan = clan
+        self._from_data(data, clan)
 
-    def _from_data(self, data: dict) -> None:
+    def _from_data(self, data: dict, clan=None) -> None:
         data_get = data.get
+        client = self._client
 
         self.exp_level: int = data_get("expLevel")
         self.trophies: int = data_get("trophies")
@@ -109,8 +138,9 @@ class ClanMember(BasePlayer):
         self.donations: int = data_get("donations")
         self.received: int = data_get("donationsReceived")
 
-        self.clan = try_enum(self.clan_cls, data=data_get("clan"), client=self._client)
-        self.arena = try_enum(self.arena_cls, data=data_get("arena") or UNRANKED_LEAGUE_DATA, client=self._client)
+        # when we're built from a clan's member list we already have the clan, so don't build another one
+        self.clan = clan if clan is not None else try_enum(self.clan_cls, data=data_get("clan"), client=client)
+        self.arena = _get_arena(self.arena_cls, data_get("arena") or UNRANKED_LEAGUE_DATA, client)
         self.role = data_get("role") and Role(value=data["role"])
         self.lastSeen = data_get("lastSeen")
         self.clan_chest_points = data_get("clanChestPoints")
@@ -148,30 +178,42 @@ class RankedPlayer(BasePlayer):
         The member's rank before the last clan leaderboard change
         (ie if Bob overtakes Jim in trophies, and they switch ranks on the leaderboard,
         and you want to find out their previous rankings, this will help.).
+    clan_cls: :class:`RankedClan`
+        The class to use to create the :attr:`RankedPlayer.clan` attribute.
+    arena_cls: :class:`Arena`
+        The class to use to create the :attr:`RankedPlayer.arena` attribute.
+
+    .. note::
+
+        The ``*_cls`` constructors are class attributes rather than per-instance ones.
+        To use your own, override them on a subclass.
     """
 
-    __slots__ = ("clan", "arena", "exp_level", "rank", "previous_rank", "trophies", "clan_cls", "arena_cls",)
-    
+    # most frequently read attributes first
+    __slots__ = ("trophies", "rank", "clan", "exp_level", "arena", "previous_rank",)
+
+    clan_cls = RankedClan
+    arena_cls = Arena
+
     def __init__(self, *, data, client, clan=None, **_):
         super().__init__(data=data, client=client)
         self._client = client
-        self.clan_cls = RankedClan
-        self.arena_cls = Arena
-        
-        self._from_data(data)
-        if clan:
-            self.clan = clan
 
-    def _from_data(self, data: dict) -> None:
+        self._from_data(data, clan)
+
+    def _from_data(self, data: dict, clan=None) -> None:
         data_get = data.get
+        client = self._client
+
         self.exp_level: int = data_get("expLevel")
         self.trophies: int = data_get("trophies")
         
         self.rank: int = data_get("rank")
         self.previous_rank: int = data_get("previousRank")
         
-        self.clan = try_enum(self.clan_cls, data=data_get("clan"), client=self._client)
-        self.arena = try_enum(self.arena_cls, data=data_get("arena") or UNRANKED_LEAGUE_DATA, client=self._client)
+        # a clan passed in by the caller is used as is, otherwise it's built from the payload
+        self.clan = clan if clan is not None else try_enum(self.clan_cls, data=data_get("clan"), client=client)
+        self.arena = _get_arena(self.arena_cls, data_get("arena") or UNRANKED_LEAGUE_DATA, client)
 
 
 class Player(BasePlayer):
@@ -183,6 +225,14 @@ class Player(BasePlayer):
     achievement_cls: :class:`Achievement`
         The constructor used to create the :attr:`Player.achievements` list.
         This must inherit from :class:`Achievement`.
+    card_cls: :class:`Card`
+        The constructor used to create the :attr:`Player.cards` and :attr:`Player.current_deck` lists.
+        This must inherit from :class:`Card`.
+    support_card_cls: :class:`SupportCard`
+        The constructor used to create the :attr:`Player.support_cards` and
+        :attr:`Player.current_deck_support_cards` lists. This must inherit from :class:`SupportCard`.
+    badge_cls: :class:`Badge`
+        The constructor used to create the :attr:`Player.badges` list. This must inherit from :class:`Badge`.
     hero_cls: :class:`Hero`
         The constructor used to create the :attr:`Player.heroes` list. This must inherit from :class:`Hero`.
     label_cls: :class:`Label`
@@ -214,37 +264,34 @@ class Player(BasePlayer):
     war_opted_in: Optional[:class:`bool`]
         Whether the player has selected that they are opted "in" (True) for wars, or opted "out" (False).
         This will be ``None`` if the player is not in a clan.
+    clan_rank: Optional[:class:`int`]
+        The player's rank in their clan, or ``None`` if the player wasn't fetched from a clan's member list.
+    clan_previous_rank: Optional[:class:`int`]
+        The player's rank in their clan before the last update, or ``None`` if the player wasn't fetched
+        from a clan's member list.
+
+    .. note::
+
+        Apart from ``clan_cls``, which comes from the client, the ``*_cls`` constructors are class attributes
+        rather than per-instance ones. To use your own, override them on a subclass.
     """
     
+    # most frequently read attributes first
     __slots__ = (
+        "trophies",
         "clan",
-        "clan_cls",
-        "_support_cards",
-        "support_card_cls",
-        "current_favorite_card",
-        "badges",
-        "badge_cls",
-        "legacy_best_trophies",
-        "current_deck",
-        "current_deck_support_cards",
+        "exp_level",
         "arena",
-        "arena_cls",
         "role",
-        "role_cls",
+        "best_trophies",
+        "donations",
+        "donations_received",
         "wins",
         "losses",
+        "current_favorite_card",
+        "legacy_best_trophies",
         "total_donations",
         "league_statistics",
-        "league_statistics_cls",
-        "_cards",
-        "card_cls",
-        "exp_level",
-        "trophies",
-        "best_trophies",
-        "donations",
-        "donations_received",
-        "_achievements",
-        "achievement_cls",
         "battle_count",
         "three_crown_wins",
         "challenge_cards_won",
@@ -256,66 +303,67 @@ class Player(BasePlayer):
         "star_points",
         "exp_points",
         "total_exp_points",
-        "season_result_cls",
         "current_season_result",
         "last_season_result",
         "best_season_result",
         "progress",
-        
-        "_iter_achievements",
-        "_iter_cards",
-        "_iter_support_cards",
+        "clan_rank",
+        "clan_previous_rank",
+        "clan_cls",
+
+        "_achievements",
+        "_raw_achievements",
+        "_raw_cards",
+        "_raw_support_cards",
+        "_raw_badges",
+        "_raw_current_deck",
+        "_raw_current_deck_support_cards",
+        "_cs_achievements",
+        "_cs_cards",
+        "_cs_support_cards",
+        "_cs_badges",
+        "_cs_current_deck",
+        "_cs_current_deck_support_cards",
     )
 
+    achievement_cls = Achievement
+    card_cls = Card
+    support_card_cls = SupportCard
+    arena_cls = Arena
+    season_result_cls = SeasonResult
+    role_cls = Role
+    league_statistics_cls = LeagueStatistics
+    badge_cls = Badge
+
     def __init__(self, *, data, client, load_game_data=None, **_):
         self._client = client
 
-        self._achievements = None  # type: Optional[dict]
-        self._cards = None  # type: Optional[dict]
-        self._support_cards = None  # type: Optional[dict]
+        self._achievements = None  # type: Optional[list]
+
+        # only known when the player was fetched through a clan's member list, see _inject_clan_member
+        self.clan_rank: Optional[int] = None
+        self.clan_previous_rank: Optional[int] = None
 
-        self.achievement_cls = Achievement
-        self.card_cls = Card
-        self.support_card_cls = SupportCard
-        self.arena_cls = Arena
+        # the clan class can be swapped out per client, so it can't live on the class
         self.clan_cls = client.objects_cls['Clan']
-        self.season_result_cls = SeasonResult
-        self.role_cls = Role
-        self.league_statistics_cls = LeagueStatistics
-        self.badge_cls = Badge
 
         super().__init__(data=data, client=client)
 
+        self._from_data(data)
+
     def _from_data(self, data: dict) -> None:
         data_get = data.get
-        # initialize all attributes
-        self.clan = try_enum(self.clan_cls, data=data_get("clan"), client=self._client)
-        self._support_cards: List[SupportCard] = [
-            try_enum(self.support_card_cls, data=adata, client=self._client) for adata in data_get("supportCards", [])]
-        self.current_favorite_card: Optional[Card] = try_enum(self.card_cls, data=data_get("currentFavouriteCard"), client=self._client)
-        self.badges: List[Badge] = [try_enum(self.badge_cls, data=adata, client=self._client) for adata in data_get("badges", [])]
-        self.legacy_best_trophies: Optional[int] = data_get("legacyTrophyRoadHighScore")
-        self.current_deck: List[Card] = [try_enum(self.card_cls, data=adata, client=self._client) for adata in data_get("currentDeck", [])]
-        self.current_deck_support_cards: List[SupportCard] = [
-            try_enum(self.support_card_cls, data=adata, client=self._client) for adata in data_get("currentDeckSupportCards", [])]
-        self.arena: Optional[Arena] = try_enum(self.arena_cls, data=data_get("arena") or UNRANKED_LEAGUE_DATA, client=self._client)
-        self.role: Optional[Role] = try_enum(self.role_cls, data=data_get("role"), client=self._client)
-        self.wins: Optional[int] = data_get("wins")
-        self.losses: Optional[int] = data_get("losses")
-        self.total_donations: Optional[int] = data_get("totalDonations")
-        self.league_statistics: Optional[LeagueStatistics] = try_enum(self.league_statistics_cls,
-                                                                      data=data_get("leagueStatistics"),
-                                                                      client=self._client)
-        self._cards: List[Card] = [
-            try_enum(self.card_cls, data=adata, client=self._client) for adata in data_get("cards", [])]
+        _try_enum = try_enum
+        client = self._client
+        card_cls = self.card_cls
+
+        # plain values, copied straight from the payload
         self.exp_level: Optional[int] = data_get("expLevel")
         self.trophies: Optional[int] = data_get("trophies")
         self.best_trophies: Optional[int] = data_get("bestTrophies")
-        self.donations: Optional[int] = data_get("donations")
-        self.donations_received: Optional[int] = data_get("donationsReceived")
-        self._achievements: List[Achievement] = [
-            try_enum(self.achievement_cls, data=adata, client=self._client) for adata in data_get("achievements", [])
-        ]
+        self.legacy_best_trophies: Optional[int] = data_get("legacyTrophyRoadHighScore")
+        self.wins: Optional[int] = data_get("wins")
+        self.losses: Optional[int] = data_get("losses")
         self.battle_count: Optional[int] = data_get("battleCount")
         self.three_crown_wins: Optional[int] = data_get("threeCrownWins")
         self.challenge_cards_won: Optional[int] = data_get("challengeCardsWon")
@@ -324,28 +372,45 @@ class Player(BasePlayer):
         self.tournament_battle_count: Optional[int] = data_get("tournamentBattleCount")
         self.war_day_wins: Optional[int] = data_get("warDayWins")
         self.clan_cards_collected: Optional[int] = data_get("clanCardsCollected")
+        self.donations: Optional[int] = data_get("donations")
+        self.donations_received: Optional[int] = data_get("donationsReceived")
+        self.total_donations: Optional[int] = data_get("totalDonations")
         self.star_points: Optional[int] = data_get("starPoints")
         self.exp_points: Optional[int] = data_get("expPoints")
         self.total_exp_points: Optional[int] = data_get("totalExpPoints")
-        self.current_season_result: Optional[SeasonResult] = try_enum(self.season_result_cls,
-                                                                      data=data_get('currentPathOfLegendSeasonResult'),
-                                                                      client=self._client)
-        self.last_season_result: Optional[SeasonResult] = try_enum(self.season_result_cls,
-                                                                   data=data_get('previousPathOfLegendSeasonResult'),
-                                                                   client=self._client)
-        self.best_season_result: Optional[SeasonResult] = try_enum(self.season_result_cls,
-                                                                   data=data_get('bestPathOfLegendSeasonResult'),
-                                                                   client=self._client)
         self.progress = data_get("progress")
-        
-
 
-    
+        # nested objects
+        self.clan = _try_enum(self.clan_cls, data=data_get("clan"), client=client)
+        self.current_favorite_card: Optional[Card] = _try_enum(card_cls, data=data_get("currentFavouriteCard"), client=client)
+        self.arena: Optional[Arena] = _get_arena(self.arena_cls, data_get("arena") or UNRANKED_LEAGUE_DATA, client)
+        self.role: Optional[Role] = _try_enum(self.role_cls, data=data_get("role"), client=client)
+        self.league_statistics: Optional[LeagueStatistics] = _try_enum(self.league_statistics_cls,
+                                                                       data=data_get("leagueStatistics"),
+                                                                       client=client)
+        season_result_cls = self.season_result_cls
+        self.current_season_result: Optional[SeasonResult] = _try_enum(season_result_cls,
+                                                                       data=data_get('currentPathOfLegendSeasonResult'),
+                                                                       client=client)
+        self.last_season_result: Optional[SeasonResult] = _try_enum(season_result_cls,
+                                                                    data=data_get('previousPathOfLegendSeasonResult'),
+                                                                    client=client)
+        self.best_season_result: Optional[SeasonResult] = _try_enum(season_result_cls,
+                                                                    data=data_get('bestPathOfLegendSeasonResult'),
+                                                                    client=client)
+
+        # lists are only turned into objects once they're accessed, see the properties below
+        self._raw_cards = data_get("cards")
+        self._raw_support_cards = data_get("supportCards")
+        self._raw_current_deck = data_get("currentDeck")
+        self._raw_current_deck_support_cards = data_get("currentDeckSupportCards")
+        self._raw_badges = data_get("badges")
+        self._raw_achievements = data_get("achievements")
 
     def _inject_clan_member(self, member):
         if member:
-            self.clan_rank = getattr(member, "clan_rank", None)
-            self.clan_previous_rank = getattr(member, "clan_previous_rank", None)
+            self.clan_rank = member.clan_rank
+            self.clan_previous_rank = member.clan_previous_rank
 
 
 
@@ -354,21 +419,47 @@ class Player(BasePlayer):
         """List[:class:`Label`]: A :class:`List` of :class:`Label`\s that the player has."""
         return list(self._iter_labels)
 
+    @cached_property("_cs_cards")
+    def cards(self) -> List[Card]:
+        """List[:class:`Card`]: A list of the player's cards."""
+        return _build_list(self.card_cls, self._raw_cards, self._client)
+
+    @cached_property("_cs_support_cards")
+    def support_cards(self) -> List[SupportCard]:
+        """List[:class:`SupportCard`]: A list of the player's support cards."""
+        return _build_list(self.support_card_cls, self._raw_support_cards, self._client)
+
+    @cached_property("_cs_current_deck")
+    def current_deck(self) -> List[Card]:
+        """List[:class:`Card`]: A list of the cards in the player's current deck."""
+        return _build_list(self.card_cls, self._raw_current_deck, self._client)
+
+    @cached_property("_cs_current_deck_support_cards")
+    def current_deck_support_cards(self) -> List[SupportCard]:
+        """List[:class:`SupportCard`]: A list of the support cards in the player's current deck."""
+        return _build_list(self.support_card_cls, self._raw_current_deck_support_cards, self._client)
+
+    @cached_property("_cs_badges")
+    def badges(self) -> List[Badge]:
+        """List[:class:`Badge`]: A list of the player's badges."""
+        return _build_list(self.badge_cls, self._raw_badges, self._client)
+
     @cached_property("_cs_achievements")
     def achievements(self) -> List[Achievement]:
         """List[:class:`Achievement`]: A list of the player's achievements."""
         # at the time of writing, the API presents achievements in the order
         # added to the game which doesn't match in-game order.
-        achievement_dict = {a.name: a for a in self._iter_achievements}
-        sorted_achievements = {}
-        for name in ACHIEVEMENT_ORDER:
-            try:
-                sorted_achievements[name] = achievement_dict[name]
-            except KeyError:
-                continue
-
-        self._achievements = sorted_achievements
-        return list(sorted_achievements.values())
+        # _achievements holds one spot per entry in ACHIEVEMENT_ORDER, so a lookup by name is just an index.
+        # achievements we don't know the position of are left out.
+        achievements = [None] * len(ACHIEVEMENT_ORDER)
+        achievement_cls = self.achievement_cls
+        for achievement in (achievement_cls(data=adata) for adata in self._raw_achievements or ()):
+            index = _ACHIEVEMENT_INDEX.get(achievement.name)
+            if index is not None:
+                achievements[index] = achievement
+
+        self._achievements = achievements
+        return [a for a in achievements if a is not None]
 
     def get_achievement(self, name: str, default_value=None) -> Optional[Achievement]:
         """Gets an achievement with the given name.
@@ -385,10 +476,12 @@ class Player(BasePlayer):
         Optional[:class:`Achievement`]
             The returned achievement or the ``default_value`` if not found, which defaults to ``None``.
         """
-        if not self._achievements:
+        if self._achievements is None:
             _ = self.achievements
 
-        try:
-            return self._achievements[name]
-        except KeyError:
+        index = _ACHIEVEMENT_INDEX.get(name)
+        if index is None:
             return default_value
+
+        achievement = self._achievements[index]
+        return default_value if achievement is None else achievement
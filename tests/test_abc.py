@@ -0,0 +1,96 @@
+import json
+import pathlib
+import tempfile
+import unittest
+
+from cr import abc
+
+
+LAB_TO_TOWNHALL = {1: 3, 2: 4, 8: 10, 10: 14, 11: 15}
+
+
+def _level(n, **kwargs):
+    meta = {"AttackRange": 100, "DPS": 10 * n, "Hitpoints": 50 * n, "Speed": 200, "UpgradeCost": 1000 * n,
+            "UpgradeTimeH": n, "LaboratoryLevel": n}
+    meta.update(kwargs)
+    return meta
+
+
+GAME_DATA = {
+    "Barbarian": {"TID": "TID_BARBARIAN", "ProductionBuilding": "Barrack", "BarrackLevel": 5, "HousingSpace": 5,
+                  "UpgradeResource": "Elixir", "TrainingTime": 20, "1": _level(1), "2": _level(2), "3": _level(3)},
+    "Barbarian King": {"TID": "TID_KING", "UpgradeResource": "DarkElixir", "TrainingTime": 0,
+                       "1": _level(1, AbilityTime=3, RequiredTownHallLevel=7),
+                       "2": _level(2, AbilityTime=4, RequiredTownHallLevel=7)},
+    "TutorialBarbarian": {"TID": "TID_BARBARIAN", "1": _level(1)},
+}
+
+BUILDINGS = {"Barrack": {"1": {"TownHallLevel": 1}, "5": {"TownHallLevel": 3}}}
+
+ENGLISH_ALIASES = {"TID_BARBARIAN": "Barbarian", "TID_KING": "Barbarian King"}
+
+
+class TroopHolder(abc.DataContainerHolder):
+    pass
+
+
+class TestDataContainerHolder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        path = pathlib.Path(cls.tmp.name)
+        (path / "characters.json").write_text(json.dumps(GAME_DATA))
+        (path / "buildings.json").write_text(json.dumps(BUILDINGS))
+
+        cls._building_file_path = abc.BUILDING_FILE_PATH
+        abc.BUILDING_FILE_PATH = str(path / "buildings.json")
+        TroopHolder.FILE_PATH = str(path / "characters.json")
+
+    @classmethod
+    def tearDownClass(cls):
+        abc.BUILDING_FILE_PATH = cls._building_file_path
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        # a fresh data object per test, since loading a fallback item from a parent writes to it
+        TroopHolder.data_object = type("Troop", (abc.DataContainer,), {})
+        TroopHolder.items = []
+        self.holder = TroopHolder()
+        self.holder._load_json(ENGLISH_ALIASES, LAB_TO_TOWNHALL)
+
+    def load(self, name, level=1):
+        return self.holder.load({"name": name, "level": level, "maxLevel": 3, "village": "home"}, townhall=10)
+
+    def test_load(self):
+        self.assertEqual([item.name for item in self.holder.items], ["Barbarian", "Barbarian King"])
+        barbarian = self.load("barbarian", level=2)
+        self.assertEqual(barbarian.dps, 20)
+        self.assertEqual(barbarian.hitpoints, 100)
+        self.assertTrue(barbarian.is_elixir_troop)
+        self.assertIs(self.holder.get("BARBARIAN"), type(barbarian))
+        self.assertIsNone(self.holder.get("Unknown"))
+
+    def test_load_from_parent_does_not_leak(self):
+        king = self.load("Barbarian King")
+        unknown = self.load("Unknown")
+        unknown._load_from_parent(self.holder.get("Barbarian"))
+
+        self.assertEqual(unknown.dps, 10)
+        self.assertIsNone(getattr(king, "is_elixir_troop", None))
+        self.assertEqual(vars(unknown)["name"], "Unknown")
+
+    def test_load_from_parent_shares_resolved_stats(self):
+        barbarian = self.holder.get("Barbarian")
+        self.load("Unknown")._load_from_parent(barbarian)
+
+        barbarian.hitpoints
+        hitpoints = barbarian.__dict__["hitpoints"]
+        unknown = self.load("Unknown", level=3)
+        unknown._load_from_parent(barbarian)
+
+        self.assertIs(type(unknown).__dict__["hitpoints"], hitpoints)
+        self.assertEqual(unknown.hitpoints, 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
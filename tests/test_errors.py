@@ -0,0 +1,15 @@
+import unittest
+
+from cr.errors import HTTPException, NotFound
+
+
+class TestHTTPException(unittest.TestCase):
+    def test_message(self):
+        self.assertEqual(str(NotFound(404, {"reason": "notFound", "message": "Not found"})),
+                         "notFound (status code: 404): Not found")
+        self.assertEqual(str(HTTPException(500, "Server error")), "Server error (status code: 500)")
+        self.assertEqual(str(HTTPException("Something broke")), "Error Occurred: Something broke")
+
+
+if __name__ == "__main__":
+    unittest.main()
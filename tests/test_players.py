@@ -0,0 +1,90 @@
+import unittest
+
+import cr
+from cr.enums import ACHIEVEMENT_ORDER
+
+
+CARD = {"name": "Knight", "id": 26000000, "level": 11, "maxLevel": 14, "count": 1, "iconUrls": {"medium": "url"}}
+
+PLAYER_DATA = {
+    "tag": "#2PP",
+    "name": "Player",
+    "expLevel": 50,
+    "trophies": 6000,
+    "arena": {"id": 54000010, "name": "Legendary Arena"},
+    "clan": {"tag": "#2CC", "name": "Clan", "badgeId": 16000000},
+    "cards": [CARD],
+    "currentDeck": [CARD],
+    "badges": [{"name": "Classic12Wins", "level": 1, "maxLevel": 1, "progress": 1, "iconUrls": {"large": "url"}}],
+    "achievements": [
+        {"name": ACHIEVEMENT_ORDER[1], "stars": 3, "value": 5, "target": 5, "info": "info", "completionInfo": None},
+        {"name": ACHIEVEMENT_ORDER[0], "stars": 1, "value": 1, "target": 5, "info": "info", "completionInfo": None},
+    ],
+}
+
+MEMBER_DATA = {
+    "tag": "#2MM",
+    "name": "Member",
+    "arena": {"id": 54000010, "name": "Legendary Arena"},
+    "clan": {"tag": "#2CC", "name": "Clan"},
+}
+
+
+class TestClanMember(unittest.TestCase):
+    def setUp(self):
+        self.client = cr.Client()
+
+    def test_arena_shared_per_client(self):
+        first = cr.ClanMember(data=MEMBER_DATA, client=self.client)
+        second = cr.ClanMember(data=dict(MEMBER_DATA, tag="#2NN"), client=self.client)
+        self.assertIs(first.arena, second.arena)
+        self.assertIsNot(first.arena, cr.ClanMember(data=MEMBER_DATA, client=cr.Client()).arena)
+
+    def test_arena_without_client(self):
+        first = cr.ClanMember(data=MEMBER_DATA, client=None)
+        second = cr.ClanMember(data=MEMBER_DATA, client=None)
+        self.assertEqual(first.arena.name, "Legendary Arena")
+        self.assertIsNot(first.arena, second.arena)
+
+    def test_clan_passed_in(self):
+        clan = object()
+        self.assertIs(cr.ClanMember(data=MEMBER_DATA, client=self.client, clan=clan).clan, clan)
+        self.assertIs(cr.RankedPlayer(data=MEMBER_DATA, client=self.client, clan=clan).clan, clan)
+        self.assertEqual(cr.ClanMember(data=MEMBER_DATA, client=self.client).clan.tag, "#2CC")
+
+    def test_hash(self):
+        member = cr.ClanMember(data=MEMBER_DATA, client=self.client)
+        self.assertEqual(hash(member), hash(cr.Player(data=MEMBER_DATA, client=self.client)))
+        self.assertEqual(len({member, cr.ClanMember(data=MEMBER_DATA, client=self.client)}), 1)
+        self.assertEqual(hash(member.clan), hash("#2CC"))
+
+
+class TestPlayer(unittest.TestCase):
+    def setUp(self):
+        self.player = cr.Player(data=PLAYER_DATA, client=cr.Client())
+
+    def test_attributes(self):
+        self.assertEqual(self.player.trophies, 6000)
+        self.assertEqual(self.player.exp_level, 50)
+        self.assertEqual(self.player.arena.name, "Legendary Arena")
+        self.assertEqual(self.player.clan.tag, "#2CC")
+
+    def test_clan_rank(self):
+        self.assertIsNone(self.player.clan_rank)
+        self.assertIsNone(self.player.clan_previous_rank)
+
+    def test_lists(self):
+        self.assertEqual(len(self.player.cards), 1)
+        self.assertEqual(len(self.player.current_deck), 1)
+        self.assertEqual(len(self.player.badges), 1)
+        self.assertEqual(self.player.support_cards, [])
+
+    def test_achievements(self):
+        # returned in game order, not the order the API sent them in
+        self.assertEqual([a.name for a in self.player.achievements], list(ACHIEVEMENT_ORDER[:2]))
+        self.assertEqual(self.player.get_achievement(ACHIEVEMENT_ORDER[1]).stars, 3)
+        self.assertIsNone(self.player.get_achievement("Not an achievement"))
+
+
+if __name__ == "__main__":
+    unittest.main()